@@ -47,51 +47,109 @@ print(result)
 import requests
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup, Tag
+import orjson
+from bs4 import BeautifulSoup, NavigableString, Tag
 import re
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import logging
 
 # 로거 유틸리티 import
 from utils.logger import setup_logger
+from utils.retry import get_retry_delay
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# Steam Store API 설정 (요청마다 다시 만들지 않도록 모듈 레벨에 둠)
+STORE_API_URL = "https://store.steampowered.com/api/appdetails"
+STORE_API_PARAMS = {
+    'cc': 'us',
+    'l': 'english'
+}
+# 응답이 멈춘 연결이 재시도 루프를 무한정 붙잡지 않도록 타임아웃 설정
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# 텍스트 변환 시 앞뒤로 줄바꿈을 넣을 블록 레벨 요소
+BLOCK_ELEMENTS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'div', 'br', 'li')
+
+# 반복 사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+INLINE_SPACE_PATTERN = re.compile(r'[ \t]+')
+WHITESPACE_ONLY_PATTERN = re.compile(r'^[ \t\n\r\f]*\n[ \t\n\r\f]*$')
+EXCESS_NEWLINE_PATTERN = re.compile(r'\n{3,}')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 요구사항 항목 라벨이 하나라도 있는지 한 번에 확인하는 패턴 (없으면 아래 패턴들은 모두 실패)
+REQUIREMENT_LABEL_PATTERN = re.compile(
+    r'(?:OS|Operating System|Processor|CPU|Memory|RAM|Graphics|Video|DirectX|Storage|Network|Additional|Sound)[^:]*:',
+    re.IGNORECASE
+)
+
+# 시스템 요구사항의 주요 항목(OS, Processor, Memory 등)을 찾기 위한 패턴
+REQUIREMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'((?:OS|Operating System)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Processor|CPU|Memory|RAM|Graphics|Video|DirectX|Storage|Network|Additional|Sound))',
+    r'((?:Processor|CPU)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Memory|RAM|Graphics|Video|DirectX|Storage|Network|Additional|Sound|OS))',
+    r'((?:Memory|RAM)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Graphics|Video|DirectX|Storage|Network|Additional|Sound|OS|Processor))',
+    r'((?:Graphics|Video)[^:]*:\s*[^A-Z]+?)(?=\s+(?:DirectX|Storage|Network|Additional|Sound|OS|Processor|Memory))',
+    r'(DirectX[^:]*:\s*[^A-Z]+?)(?=\s+(?:Storage|Network|Additional|Sound|OS|Processor|Memory|Graphics))',
+    r'((?:Storage|Network)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Additional|Sound|OS|Processor|Memory|Graphics|DirectX))',
+    r'((?:Additional|Sound)[^:]*:\s*.+?)(?=\s+(?:OS|Processor|Memory|Graphics|DirectX|Storage|Network)|\s*$)'
+))
+
+# 같은 HTML이 반복해서 들어오는 경우(재수집, 같은 엔진/퍼블리셔의 요구사항 등) 변환 결과를 재사용
+# 메모리가 커지지 않도록 적당한 길이의 입력만 캐시
+MAX_CACHED_HTML_LENGTH = 16 * 1024
+HTML_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=HTML_CACHE_SIZE)
+def _html_to_text_cached(html_content: str) -> str:
+    return _html_to_text(html_content)
+
+@lru_cache(maxsize=HTML_CACHE_SIZE)
+def _clean_system_requirements_cached(html_content: str) -> str:
+    return _clean_system_requirements(html_content)
+
 def html_to_text(html_content: str) -> str:
     """HTML을 읽기 쉬운 텍스트로 변환합니다 (구조 보존)."""
     if not html_content:
         return ""
-    
-    # BeautifulSoup으로 HTML 파싱
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # 블록 레벨 요소들을 줄바꿈으로 교체
-    block_elements = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'div', 'br', 'li']
-    
-    # HTML을 문자열로 변환하여 정규식으로 처리
-    html_str = str(soup)
-    
-    # 블록 요소들 앞뒤에 줄바꿈 추가
-    for element in block_elements:
-        # 여는 태그 앞에 줄바꿈
-        html_str = re.sub(f'<{element}[^>]*>', f'\n<{element}>', html_str)
-        # 닫는 태그 뒤에 줄바꿈  
-        html_str = re.sub(f'</{element}>', f'</{element}>\n', html_str)
-    
-    # br 태그는 단순 줄바꿈으로 교체
-    html_str = re.sub(r'<br[^>]*>', '\n', html_str)
-    
-    # 다시 BeautifulSoup으로 파싱하여 텍스트 추출
-    soup = BeautifulSoup(html_str, 'html.parser')
-    text = soup.get_text()
+    if len(html_content) <= MAX_CACHED_HTML_LENGTH:
+        return _html_to_text_cached(html_content)
+    return _html_to_text(html_content)
+
+def _html_to_text(html_content: str) -> str:
+    """html_to_text의 실제 변환 로직 (캐시 래퍼에서 호출)"""
+    if '<' not in html_content and '&' not in html_content and '\r' not in html_content:
+        # 태그나 엔티티가 없는 일반 텍스트는 파싱 없이 바로 정리 작업으로 넘어감
+        text = html_content
+    else:
+        # BeautifulSoup으로 HTML 파싱
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # 파싱한 트리에서 바로 블록 요소 앞뒤에 줄바꿈을 넣음 (문자열 변환 후 재파싱하지 않음)
+        for element in soup.find_all(BLOCK_ELEMENTS):
+            if element.name == 'br':
+                # br 태그는 단순 줄바꿈으로 교체
+                element.replace_with('\n\n')
+            else:
+                element.insert_before('\n')
+                element.insert_after('\n')
+        
+        # 이웃한 텍스트 노드를 합치고, 공백뿐인 노드는 HTML을 다시 파싱했을 때처럼 줄바꿈 하나로 줄임
+        soup.smooth()
+        for string in soup.find_all(string=WHITESPACE_ONLY_PATTERN):
+            if type(string) is NavigableString and string != '\n' and string.parent.name not in ('pre', 'textarea'):
+                string.replace_with('\n')
+        
+        text = soup.get_text()
     
     # 정리 작업
     # 1. 연속된 공백을 하나로 (단, 줄바꿈은 유지)
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = INLINE_SPACE_PATTERN.sub(' ', text)
     
     # 2. 연속된 줄바꿈을 최대 2개로 제한
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = EXCESS_NEWLINE_PATTERN.sub('\n\n', text)
     
     # 3. 각 줄의 앞뒤 공백 제거
     lines = text.split('\n')
@@ -109,41 +167,50 @@ def html_to_text(html_content: str) -> str:
             result_lines.append(line)
             prev_empty = False
     
-    # 5. 시작과 끝의 빈 줄 제거
-    while len(result_lines) > 0 and result_lines[0] == '':
-        result_lines.pop(0)
-    while len(result_lines) > 0 and result_lines[-1] == '':
-        result_lines.pop()
+    # 5. 시작과 끝의 빈 줄 제거 (pop(0) 반복 대신 인덱스를 찾아 한 번에 슬라이스)
+    start, end = 0, len(result_lines)
+    while start < end and result_lines[start] == '':
+        start += 1
+    while end > start and result_lines[end - 1] == '':
+        end -= 1
     
-    return '\n'.join(result_lines)
+    return '\n'.join(result_lines[start:end])
 
 def clean_system_requirements(html_content: str) -> str:
     """시스템 요구사항 HTML을 읽기 쉬운 텍스트로 변환합니다."""
     if not html_content:
         return ""
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
+    if len(html_content) <= MAX_CACHED_HTML_LENGTH:
+        return _clean_system_requirements_cached(html_content)
+    return _clean_system_requirements(html_content)
+
+def _clean_system_requirements(html_content: str) -> str:
+    """clean_system_requirements의 실제 변환 로직 (캐시 래퍼에서 호출)"""
     result = []
     
     # 현재 섹션 추적
     current_section = ""
     
-    # 모든 요소를 순서대로 처리
-    for element in soup.find_all(['strong', 'li']):
-        # Tag 타입인지 확인하여 linter 오류 수정
-        if isinstance(element, Tag) and element.name == 'strong':
-            text = element.get_text().strip()
-            # 메인 섹션 제목 (Minimum:, Recommended:)만 처리
-            if text in ['Minimum:', 'Recommended:']:
-                if result:  # 이전 섹션이 있으면 줄바꿈 추가
-                    result.append('\n\n')
-                result.append(f"{text}\n")
-                current_section = text
-        elif isinstance(element, Tag) and element.name == 'li' and current_section:
-            # 리스트 항목 처리
-            li_text = element.get_text().strip()
-            if li_text:
-                result.append(f"- {li_text}\n")
+    # 태그가 없는 텍스트는 아래의 텍스트 기반 방법으로 바로 처리
+    if '<' in html_content:
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # 모든 요소를 순서대로 처리
+        for element in soup.find_all(['strong', 'li']):
+            # Tag 타입인지 확인하여 linter 오류 수정
+            if isinstance(element, Tag) and element.name == 'strong':
+                text = element.get_text().strip()
+                # 메인 섹션 제목 (Minimum:, Recommended:)만 처리
+                if text in ['Minimum:', 'Recommended:']:
+                    if result:  # 이전 섹션이 있으면 줄바꿈 추가
+                        result.append('\n\n')
+                    result.append(f"{text}\n")
+                    current_section = text
+            elif isinstance(element, Tag) and element.name == 'li' and current_section:
+                # 리스트 항목 처리
+                li_text = element.get_text().strip()
+                if li_text:
+                    result.append(f"- {li_text}\n")
     
     # 위 방법이 작동하지 않으면 더 간단한 방법 사용
     if not result or len(result) <= 2:
@@ -193,22 +260,14 @@ def format_requirements_text(content: str) -> str:
     # OS:, Processor:, Memory: 등의 패턴을 찾아서 각각을 리스트 항목으로 만듦
     formatted_items = []
     
-    # 주요 요구사항 항목들을 찾기 위한 패턴
-    patterns = [
-        r'((?:OS|Operating System)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Processor|CPU|Memory|RAM|Graphics|Video|DirectX|Storage|Network|Additional|Sound))',
-        r'((?:Processor|CPU)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Memory|RAM|Graphics|Video|DirectX|Storage|Network|Additional|Sound|OS))',
-        r'((?:Memory|RAM)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Graphics|Video|DirectX|Storage|Network|Additional|Sound|OS|Processor))',
-        r'((?:Graphics|Video)[^:]*:\s*[^A-Z]+?)(?=\s+(?:DirectX|Storage|Network|Additional|Sound|OS|Processor|Memory))',
-        r'(DirectX[^:]*:\s*[^A-Z]+?)(?=\s+(?:Storage|Network|Additional|Sound|OS|Processor|Memory|Graphics))',
-        r'((?:Storage|Network)[^:]*:\s*[^A-Z]+?)(?=\s+(?:Additional|Sound|OS|Processor|Memory|Graphics|DirectX))',
-        r'((?:Additional|Sound)[^:]*:\s*.+?)(?=\s+(?:OS|Processor|Memory|Graphics|DirectX|Storage|Network)|\s*$)'
-    ]
-    
     content = content.strip()
     used_positions = set()
     
+    # 라벨이 전혀 없으면 7개 패턴을 차례로 돌려 볼 필요 없이 전체 텍스트를 하나의 항목으로 처리
+    patterns = REQUIREMENT_PATTERNS if REQUIREMENT_LABEL_PATTERN.search(content) else ()
+    
     for pattern in patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
+        matches = pattern.finditer(content)
         for match in matches:
             start, end = match.span()
             # 이미 사용된 위치와 겹치지 않는지 확인
@@ -216,72 +275,84 @@ def format_requirements_text(content: str) -> str:
                 item = match.group(1).strip()
                 if item and len(item) > 5:  # 너무 짧은 항목 제외
                     # 줄바꿈과 여분의 공백 정리
-                    item = re.sub(r'\s+', ' ', item)
+                    item = WHITESPACE_PATTERN.sub(' ', item)
                     formatted_items.append(f"- {item}")
                     used_positions.add((start, end))
     
     # 패턴으로 찾지 못한 경우 전체 텍스트를 하나의 항목으로
     if not formatted_items and content:
-        content = re.sub(r'\s+', ' ', content)
+        content = WHITESPACE_PATTERN.sub(' ', content)
         formatted_items.append(f"- {content}")
     
     return '\n'.join(formatted_items) + '\n' if formatted_items else ""
 
 # 비동기 버전 (기본 버전)
-async def get_steam_game_info_api(app_id: int, max_retries: int = 7) -> Dict[str, Any]:
-    """게임 상세 정보를 가져옵니다 (기본 비동기 버전)."""
-    base_url = f"https://store.steampowered.com/api/appdetails"
-    params = {
-        'appids': app_id,
-        'cc': 'us',
-        'l': 'english'
-    }
-    logger.info(f"게임 API 정보 요청 중: {app_id}")
+async def get_steam_game_info_api(app_id: int, max_retries: int = 7,
+                                  session: Optional[aiohttp.ClientSession] = None,
+                                  semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+    """게임 상세 정보를 가져옵니다 (기본 비동기 버전).
+    
+    session을 넘기면 해당 세션의 연결 풀을 재사용하고, 없으면 요청용 세션을 새로 만듭니다.
+    semaphore를 넘기면 요청을 보내고 응답을 읽는 동안에만 슬롯을 잡고, 재시도 대기 중에는 반납합니다.
+    """
+    if session is None:
+        async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as own_session:
+            return await get_steam_game_info_api(app_id, max_retries, own_session, semaphore)
+    
+    params = {'appids': app_id, **STORE_API_PARAMS}
+    request_slot = semaphore if semaphore is not None else nullcontext()
+    logger.debug(f"게임 API 정보 요청 중: {app_id}")
     for attempt in range(max_retries + 1):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(base_url, params=params) as response:
-                    # 성공적인 응답
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            'success': True,
-                            'data': data.get(str(app_id),{}).get('data',{}),
-                            'app_id': app_id
-                        }
-                    
-                    # 요청 제한 관련 상태 코드 (Steam은 403도 사용)
-                    elif response.status in [403, 429, 503, 502, 504]:
-                        if attempt < max_retries:
-                            # 지수적으로 증가하는 딜레이 (2초, 4초, 8초, 16초, 32초, 64초, 128초)
-                            delay = 2 * (2 ** attempt)
-                            logger.warning(f"게임 ID {app_id}: HTTP {response.status} - {attempt + 1}회 실패, {delay}초 후 재시도...")
-                            await asyncio.sleep(delay)
-                            continue
-                        else:
-                            logger.error(f"게임 ID {app_id}: HTTP {response.status} - 최대 재시도 횟수 초과")
-                            return {
-                                'success': False,
-                                'error': 'rate_limit_exceeded',
-                                'message': f'HTTP {response.status} - 최대 재시도 횟수 ({max_retries}) 초과',
-                                'app_id': app_id,
-                                'http_status': response.status
-                            }
-                    
-                    # 기타 HTTP 에러
-                    else:
-                        logger.error(f"게임 ID {app_id}: HTTP {response.status} 오류")
-                        return {
-                            'success': False,
-                            'error': 'http_error',
-                            'message': f'HTTP {response.status} 오류',
-                            'app_id': app_id,
-                            'http_status': response.status
-                        }
-                        
+            # 상태/본문만 읽고 바로 블록을 빠져나와 연결과 동시 요청 슬롯을 반납
+            async with request_slot, session.get(STORE_API_URL, params=params) as response:
+                status = response.status
+                if status == 200:
+                    body = await response.read()
+            
+            # 성공적인 응답
+            if status == 200:
+                data = orjson.loads(body)
+                return {
+                    'success': True,
+                    'data': data.get(str(app_id),{}).get('data',{}),
+                    'app_id': app_id
+                }
+            
+            # 요청 제한 관련 상태 코드 (Steam은 403도 사용)
+            elif status in [403, 429, 503, 502, 504]:
+                if attempt < max_retries:
+                    delay = get_retry_delay(response, attempt)
+                    logger.warning(f"게임 ID {app_id}: HTTP {status} - {attempt + 1}회 실패, {delay:.0f}초 후 재시도...")
+                    await asyncio.sleep(delay)
+                    continue
+                else:
+                    logger.error(f"게임 ID {app_id}: HTTP {status} - 최대 재시도 횟수 초과")
+                    return {
+                        'success': False,
+                        'error': 'rate_limit_exceeded',
+                        'message': f'HTTP {status} - 최대 재시도 횟수 ({max_retries}) 초과',
+                        'app_id': app_id,
+                        'http_status': status
+                    }
+            
+            # 기타 HTTP 에러
+            else:
+                logger.error(f"게임 ID {app_id}: HTTP {status} 오류")
+                return {
+                    'success': False,
+                    'error': 'http_error',
+                    'message': f'HTTP {status} 오류',
+                    'app_id': app_id,
+                    'http_status': status
+                }
+                
         except Exception as e:
-            if attempt < max_retries and "HTTP" in str(e) and any(code in str(e) for code in ["403", "429", "503", "502", "504"]):
-                # 재시도 가능한 네트워크 오류
+            retryable = isinstance(e, asyncio.TimeoutError) or (
+                "HTTP" in str(e) and any(code in str(e) for code in ["403", "429", "503", "502", "504"])
+            )
+            if attempt < max_retries and retryable:
+                # 재시도 가능한 네트워크 오류 (타임아웃 포함)
                 delay = 2 * (2 ** attempt)
                 logger.warning(f"게임 ID {app_id}: 네트워크 오류 - {attempt + 1}회 실패, {delay}초 후 재시도... ({str(e)})")
                 await asyncio.sleep(delay)
@@ -320,10 +391,22 @@ def get_steam_game_info_api_sync(app_id: int, max_retries: int = 7) -> Dict[str,
     return asyncio.run(get_steam_game_info_api(app_id, max_retries))
 
 # 여러 게임 동시 처리
-async def get_multiple_games_api(app_ids: list[int], max_retries: int = 7) -> Dict[int, Dict[str, Any]]:
-    """여러 게임의 상세 정보를 동시에 가져옵니다 (기본 비동기 버전)."""
-    tasks = [get_steam_game_info_api(app_id, max_retries) for app_id in app_ids]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+async def get_multiple_games_api(app_ids: list[int], max_retries: int = 7,
+                                 max_concurrency: int = 8) -> Dict[int, Dict[str, Any]]:
+    """여러 게임의 상세 정보를 동시에 가져옵니다 (기본 비동기 버전).
+    
+    하나의 세션(연결 풀)을 공유하고, 동시에 진행되는 요청 수는 max_concurrency로 제한합니다.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=max_concurrency, ttl_dns_cache=300)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT) as session:
+        async def fetch(app_id: int) -> Dict[str, Any]:
+            # 재시도 대기 중에는 슬롯을 반납하도록 세마포어를 요청 함수에 넘김
+            return await get_steam_game_info_api(app_id, max_retries, session, semaphore)
+        
+        tasks = [fetch(app_id) for app_id in app_ids]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
     
     # 결과를 딕셔너리로 매핑
     game_data = {}
@@ -339,12 +422,16 @@ async def get_multiple_games_api(app_ids: list[int], max_retries: int = 7) -> Di
         else:
             game_data[app_id] = result
     
+    # 게임별 로그 대신 요약만 출력
+    success_count = sum(1 for result in game_data.values() if result.get('success'))
+    logger.info(f"게임 API 정보 수집 완료: {success_count}/{len(game_data)}개 성공")
     return game_data
 
 # 편의 함수
-def get_multiple_games_api_sync(app_ids: list[int], max_retries: int = 7) -> Dict[int, Dict[str, Any]]:
+def get_multiple_games_api_sync(app_ids: list[int], max_retries: int = 7,
+                                max_concurrency: int = 8) -> Dict[int, Dict[str, Any]]:
     """여러 게임의 상세 정보를 가져옵니다 (동기 버전 - 편의 함수)."""
-    return asyncio.run(get_multiple_games_api(app_ids, max_retries))
+    return asyncio.run(get_multiple_games_api(app_ids, max_retries, max_concurrency))
 
 # 테스트 함수들
 # 동기 vs 비동기 비교
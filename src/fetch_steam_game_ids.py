@@ -8,6 +8,7 @@ Steam API를 사용하여 Steam 플랫폼에서 사용 가능한 모든 게임
 - Steam GetAppList API를 통한 전체 게임 ID 수집
 - 선택적 제한 옵션 (테스트용)
 - 중복 제거된 게임 ID Set 반환
+- 전체 목록 로컬 캐시 (24시간, refresh=True로 갱신)
 
 사용 예시:
 ```python
@@ -22,41 +23,130 @@ limited_ids = get_all_steam_games(limit=100)
 ```
 """
 
+import orjson
 import requests
-from typing import Set, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Set, Optional
+from itertools import islice
+from pathlib import Path
+import os
+import time
 import logging
 from utils.logger import setup_logger
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-def get_all_steam_games(limit: Optional[int] = None) -> Set[int]:
-    """Steam API에서 모든 게임 목록을 가져옵니다."""
-    steam_api_base_url = "http://api.steampowered.com/ISteamApps/GetAppList/v0002/"
-    headers = {
+# 요청 타임아웃 (연결, 읽기)
+REQUEST_TIMEOUT = (3.05, 10)
+
+# 게임 ID 목록 캐시 (전체 목록은 하루 단위로만 바뀌므로 재실행 시 재사용)
+APP_LIST_CACHE_PATH = Path("data/steam_app_ids.txt")
+APP_LIST_CACHE_TTL = 24 * 60 * 60
+
+
+def _create_session() -> requests.Session:
+    """keep-alive 연결을 재사용하는 세션을 생성합니다."""
+    session = requests.Session()
+    session.headers.update({
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    })
+    
+    # 요청 제한/서버 오류는 어댑터 레벨에서 지수 백오프로 재시도
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# 모듈 전역 세션 (호출마다 TCP/TLS 핸드셰이크를 반복하지 않도록 재사용)
+_session = _create_session()
+
+
+def _load_cached_game_ids() -> Optional[List[int]]:
+    """캐시가 유효 기간 내라면 저장된 게임 ID 목록을 반환합니다."""
+    if not APP_LIST_CACHE_PATH.exists():
+        return None
+    if time.time() - APP_LIST_CACHE_PATH.stat().st_mtime >= APP_LIST_CACHE_TTL:
+        return None
+    try:
+        # 디코딩 없이 바이트를 줄 단위로 나눠 map(int)로 한 번에 변환
+        return list(map(int, APP_LIST_CACHE_PATH.read_bytes().split()))
+    except (OSError, ValueError) as e:
+        # 읽을 수 없거나 손상된 캐시는 없는 것으로 보고 API에서 다시 가져옴
+        logger.warning(f"게임 ID 캐시를 읽을 수 없어 무시합니다: {APP_LIST_CACHE_PATH} ({str(e)})")
+        return None
+
+
+def _save_cached_game_ids(game_ids: List[int]) -> None:
+    """게임 ID 목록을 API 응답 순서 그대로 캐시 파일에 저장합니다."""
+    APP_LIST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # 쓰는 도중 중단되어도 잘린 목록이 캐시로 남지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = APP_LIST_CACHE_PATH.with_name(APP_LIST_CACHE_PATH.name + '.tmp')
+    try:
+        tmp_path.write_text('\n'.join(map(str, game_ids)), encoding='utf-8')
+        os.replace(tmp_path, APP_LIST_CACHE_PATH)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def get_all_steam_games(limit: Optional[int] = None, refresh: bool = False) -> Set[int]:
+    """
+    Steam API에서 모든 게임 목록을 가져옵니다.
+    
+    전체 목록은 하루 동안 로컬 파일에 캐시되며, refresh=True이면 캐시를 무시하고 다시 가져옵니다.
+    """
+    steam_api_base_url = "http://api.steampowered.com/ISteamApps/GetAppList/v0002/"
+    
+    if not refresh:
+        cached_ids = _load_cached_game_ids()
+        if cached_ids is not None:
+            # 캐시는 API 응답 순서로 저장되어 있으므로 limit을 주면 API에서 가져올 때와 같은 ID를 반환
+            game_ids = set(islice(cached_ids, limit)) if limit else set(cached_ids)
+            logger.info(f"캐시에서 {len(game_ids)}개의 게임 ID를 불러왔습니다: {APP_LIST_CACHE_PATH}")
+            return game_ids
     
     try:
         logger.info("Steam API에서 게임 목록을 가져오는 중...")
-        response = requests.get(steam_api_base_url, headers=headers)
+        response = _session.get(steam_api_base_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             apps = data.get('applist', {}).get('apps', [])
             
-            game_ids = set()
-            for app in apps:
-                app_id = app.get('appid')
-                if app_id:
-                    game_ids.add(int(app_id))
-                    
-                    # 제한이 설정된 경우 해당 수만큼만 가져오기
-                    if limit and len(game_ids) >= limit:
-                        break
+            if not limit:
+                # 전체 목록은 API 응답 순서를 유지한 채 중복만 제거 (캐시에 같은 순서로 저장)
+                ordered_ids = list(dict.fromkeys(int(app['appid']) for app in apps if app.get('appid')))
+                game_ids = set(ordered_ids)
+            else:
+                game_ids = set()
+                for app in apps:
+                    app_id = app.get('appid')
+                    if app_id:
+                        game_ids.add(int(app_id))
+                        
+                        # 제한이 설정된 경우 해당 수만큼만 가져오기
+                        if len(game_ids) >= limit:
+                            break
             
             logger.info(f"총 {len(game_ids)}개의 게임 ID를 가져왔습니다.")
+            
+            # 제한 없이 가져온 전체 목록만 캐시
+            if not limit and game_ids:
+                try:
+                    _save_cached_game_ids(ordered_ids)
+                except OSError as e:
+                    # 캐시 저장 실패는 가져온 결과에 영향을 주지 않음
+                    logger.warning(f"게임 ID 캐시 저장 실패: {APP_LIST_CACHE_PATH} ({str(e)})")
             return game_ids
         else:
             logger.error(f"Steam API 오류: {response.status_code}")
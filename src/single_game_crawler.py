@@ -33,7 +33,7 @@ from bs4 import BeautifulSoup
 from typing import Dict, List, Optional, Any
 import re
 from datetime import datetime
-import json
+import orjson
 import csv
 import os
 from pathlib import Path
@@ -45,7 +45,63 @@ from utils.logger import setup_logger
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 반복 사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+WHITESPACE_PATTERN = re.compile(r'\s+')
+GENRE_LINE_PATTERN = re.compile(r'Genre:\s*(.+?)(?:\n|$)')
+GENRES_PATTERN = re.compile(r'Genre[s]?[:\s]+([^\n\r]+)', re.IGNORECASE)
+GENRE_SPLIT_PATTERN = re.compile(r'[,;/]')
+DISCOUNT_PATTERN = re.compile(r'-(\d+)%')
+DEVELOPER_PATTERN = re.compile(r'Developer[:\s]+([^\n\r]+)', re.IGNORECASE)
+PUBLISHER_PATTERN = re.compile(r'Publisher[:\s]+([^\n\r]+)', re.IGNORECASE)
+REVIEW_COUNT_PATTERN = re.compile(r'\((\d{1,3}(?:,\d{3})*)\)')
+REVIEW_PERCENT_PATTERN = re.compile(r'(\d+)%\s+of\s+the\s+\d+')
+REVIEW_SUMMARY_PATTERN = re.compile(r'(\d+)%\s+of\s+the\s+([\d,]+)\s+user\s+reviews')
+UNSAFE_FILENAME_PATTERN = re.compile(r'[<>:"|?*]')
+
 class ComprehensiveGameCrawler:
+    # 페이지마다 리스트를 새로 만들지 않도록 CSS 선택자를 클래스 상수로 둠
+    TITLE_SELECTORS = (
+        'div.apphub_AppName',
+        'h1.pageheader',
+        '.game_title h1',
+        '#appHubAppName',
+    )
+    DESC_SELECTORS = (
+        '.game_description_snippet',
+        '.game_area_description .game_description_snippet',
+    )
+    TAG_SELECTORS = (
+        'a.app_tag',
+        '.popular_tags a',
+        '.game_area_details_specs a',
+    )
+    CURRENT_PRICE_SELECTORS = (
+        '.game_purchase_price',
+        '.discount_final_price',
+    )
+    POSSIBLE_SELECTORS = (
+        '.glance_ctn .summary',
+        '.details_block .summary',
+        '.game_area_details .summary',
+    )
+    RELEASE_SELECTORS = (
+        '.release_date .date',
+        '.game_area_release_date .date',
+    )
+    HEADER_SELECTORS = (
+        '.game_header_image_full',
+        '.game_header_image img',
+        '.page_header_image img',
+    )
+    # 장르 링크를 실제 장르로 인정할 때 사용하는 키워드 (링크마다 리스트를 다시 만들지 않도록 상수로 둠)
+    COMMON_GENRES = (
+        'Action', 'Adventure', 'RPG', 'Strategy', 'Simulation',
+        'Sports', 'Racing', 'Puzzle', 'Platformer', 'Shooter',
+        'Fighting', 'Horror', 'Survival', 'Arcade', 'Casual',
+        'Indie', 'MMO', 'Multiplayer', 'Co-op', 'VR', 'Free to Play',
+        'Early Access',
+    )
+
     def __init__(self):
         self.base_url = "https://store.steampowered.com/app/"
         self.headers = {
@@ -90,14 +146,7 @@ class ComprehensiveGameCrawler:
         info = {}
         
         # 게임 제목
-        title_selectors = [
-            'div.apphub_AppName',
-            'h1.pageheader',
-            '.game_title h1',
-            '#appHubAppName'
-        ]
-        
-        for selector in title_selectors:
+        for selector in self.TITLE_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 info['title'] = element.get_text(strip=True)
@@ -107,12 +156,7 @@ class ComprehensiveGameCrawler:
             info['title'] = "Unknown"
         
         # 게임 짧은 설명
-        desc_selectors = [
-            '.game_description_snippet',
-            '.game_area_description .game_description_snippet'
-        ]
-        
-        for selector in desc_selectors:
+        for selector in self.DESC_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 info['description'] = element.get_text(strip=True)
@@ -190,7 +234,7 @@ class ComprehensiveGameCrawler:
             # 텍스트 정리
             if detailed_desc:
                 # 불필요한 공백과 줄바꿈 정리
-                detailed_desc = re.sub(r'\s+', ' ', detailed_desc).strip()
+                detailed_desc = WHITESPACE_PATTERN.sub(' ', detailed_desc).strip()
                 # 너무 긴 경우 제한 (5000자)
                 if len(detailed_desc) > 5000:
                     detailed_desc = detailed_desc[:5000] + "..."
@@ -202,23 +246,18 @@ class ComprehensiveGameCrawler:
 
     def extract_tags(self, soup: BeautifulSoup) -> List[str]:
         """게임 태그를 추출합니다."""
-        tags = []
-        tag_selectors = [
-            'a.app_tag',
-            '.popular_tags a',
-            '.game_area_details_specs a'
-        ]
-        
-        for selector in tag_selectors:
+        # 순서를 유지하면서 중복을 O(1)로 거르도록 dict를 순서 있는 집합으로 사용
+        tags: Dict[str, None] = {}
+        for selector in self.TAG_SELECTORS:
             tag_elements = soup.select(selector)
             if tag_elements:
                 for tag in tag_elements:
                     tag_text = tag.get_text(strip=True)
-                    if tag_text and tag_text not in tags:
-                        tags.append(tag_text)
+                    if tag_text:
+                        tags[tag_text] = None
                 break
         
-        return tags
+        return list(tags)
 
     def extract_genres(self, soup: BeautifulSoup) -> List[str]:
         """게임 장르를 추출합니다."""
@@ -248,16 +287,9 @@ class ComprehensiveGameCrawler:
                         # 개발사/퍼블리셔가 아닌 실제 장르인지 확인
                         if genre_name and len(genre_name) < 50 and genre_name not in genres:
                             # 일반적인 장르 키워드 필터링
-                            common_genres = [
-                                'Action', 'Adventure', 'RPG', 'Strategy', 'Simulation', 
-                                'Sports', 'Racing', 'Puzzle', 'Platformer', 'Shooter',
-                                'Fighting', 'Horror', 'Survival', 'Arcade', 'Casual',
-                                'Indie', 'MMO', 'Multiplayer', 'Co-op', 'VR', 'Free to Play',
-                                'Early Access'
-                            ]
-                            if any(common in genre_name for common in common_genres):
+                            if any(common in genre_name for common in self.COMMON_GENRES):
                                 genres.append(genre_name)
-                            elif genre_name in common_genres:
+                            elif genre_name in self.COMMON_GENRES:
                                 genres.append(genre_name)
             
             # 방법 3: details_block에서 "Genre:" 패턴으로 찾기
@@ -267,10 +299,10 @@ class ComprehensiveGameCrawler:
                     block_text = block.get_text()
                     if 'Genre:' in block_text:
                         # Genre: 다음의 링크들 찾기
-                        genre_pattern = re.search(r'Genre:\s*(.+?)(?:\n|$)', block_text)
+                        genre_pattern = GENRE_LINE_PATTERN.search(block_text)
                         if genre_pattern:
-                            genre_text = genre_pattern.group(1).strip()
-                            # 쉼표로 구분된 장르들 분리
+                            genre_text = genre_pattern.group(1)
+                            # 쉼표로 구분된 장르들 분리 (각 항목을 strip하므로 전체 strip은 생략)
                             for genre in genre_text.split(','):
                                 genre = genre.strip()
                                 if genre and genre not in genres:
@@ -287,11 +319,10 @@ class ComprehensiveGameCrawler:
             # 방법 4: 전체 텍스트에서 "Genre:" 패턴 찾기
             if not genres:
                 all_text = soup.get_text()
-                genre_matches = re.findall(r'Genre[s]?[:\s]+([^\n\r]+)', all_text, re.IGNORECASE)
+                genre_matches = GENRES_PATTERN.findall(all_text)
                 for match in genre_matches:
-                    match = match.strip()
-                    # 쉼표나 기타 구분자로 분리
-                    for genre in re.split(r'[,;/]', match):
+                    # 쉼표나 기타 구분자로 분리 (각 항목을 strip하므로 전체 strip은 생략)
+                    for genre in GENRE_SPLIT_PATTERN.split(match):
                         genre = genre.strip()
                         if genre and len(genre) < 50 and genre not in genres:
                             genres.append(genre)
@@ -326,12 +357,7 @@ class ComprehensiveGameCrawler:
                 return price_info
         
         # 현재 가격
-        current_price_selectors = [
-            '.game_purchase_price',
-            '.discount_final_price'
-        ]
-        
-        for selector in current_price_selectors:
+        for selector in self.CURRENT_PRICE_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 price_text = element.get_text(strip=True)
@@ -349,7 +375,7 @@ class ComprehensiveGameCrawler:
         if discount_element:
             discount_text = discount_element.get_text(strip=True)
             # "-50%" 형태에서 숫자만 추출
-            discount_match = re.search(r'-(\d+)%', discount_text)
+            discount_match = DISCOUNT_PATTERN.search(discount_text)
             if discount_match:
                 price_info['discount_percent'] = int(discount_match.group(1))
         
@@ -413,25 +439,19 @@ class ComprehensiveGameCrawler:
                 all_text = soup.get_text()
                 
                 # Developer 패턴 찾기
-                dev_match = re.search(r'Developer[:\s]+([^\n\r]+)', all_text, re.IGNORECASE)
+                dev_match = DEVELOPER_PATTERN.search(all_text)
                 if dev_match and not dev_pub_info['developer']:
                     dev_pub_info['developer'] = dev_match.group(1).strip()
                 
                 # Publisher 패턴 찾기
-                pub_match = re.search(r'Publisher[:\s]+([^\n\r]+)', all_text, re.IGNORECASE)
+                pub_match = PUBLISHER_PATTERN.search(all_text)
                 if pub_match and not dev_pub_info['publisher']:
                     dev_pub_info['publisher'] = pub_match.group(1).strip()
             
             # 방법 5: 특정 클래스명으로 찾기
             if not dev_pub_info['developer'] or not dev_pub_info['publisher']:
                 # 다른 가능한 선택자들
-                possible_selectors = [
-                    '.glance_ctn .summary',
-                    '.details_block .summary',
-                    '.game_area_details .summary'
-                ]
-                
-                for selector in possible_selectors:
+                for selector in self.POSSIBLE_SELECTORS:
                     elements = soup.select(selector)
                     for i, elem in enumerate(elements):
                         text = elem.get_text(strip=True).lower()
@@ -452,12 +472,7 @@ class ComprehensiveGameCrawler:
 
     def extract_release_date(self, soup: BeautifulSoup) -> Optional[str]:
         """출시일을 추출합니다."""
-        release_selectors = [
-            '.release_date .date',
-            '.game_area_release_date .date'
-        ]
-        
-        for selector in release_selectors:
+        for selector in self.RELEASE_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 return element.get_text(strip=True)
@@ -494,24 +509,24 @@ class ComprehensiveGameCrawler:
                 # 최근 리뷰 섹션
                 if 'Recent Reviews' in section_text or '최근 리뷰' in section_text:
                     # 괄호 안의 숫자 추출 (리뷰 개수)
-                    count_match = re.search(r'\((\d{1,3}(?:,\d{3})*)\)', section_text)
+                    count_match = REVIEW_COUNT_PATTERN.search(section_text)
                     if count_match:
                         review_info['recent_review_count'] = count_match.group(1)
                     
                     # 퍼센트 추출 - 더 정확한 패턴
-                    percent_match = re.search(r'(\d+)%\s+of\s+the\s+\d+', section_text)
+                    percent_match = REVIEW_PERCENT_PATTERN.search(section_text)
                     if percent_match:
                         review_info['recent_positive_percent'] = int(percent_match.group(1))
                 
                 # 전체 리뷰 섹션
                 elif 'All Reviews' in section_text or '모든 리뷰' in section_text:
                     # 괄호 안의 숫자 추출 (리뷰 개수)
-                    count_match = re.search(r'\((\d{1,3}(?:,\d{3})*)\)', section_text)
+                    count_match = REVIEW_COUNT_PATTERN.search(section_text)
                     if count_match:
                         review_info['total_review_count'] = count_match.group(1)
                     
                     # 퍼센트 추출 - 더 정확한 패턴
-                    percent_match = re.search(r'(\d+)%\s+of\s+the\s+\d+', section_text)
+                    percent_match = REVIEW_PERCENT_PATTERN.search(section_text)
                     if percent_match:
                         review_info['total_positive_percent'] = int(percent_match.group(1))
             
@@ -523,7 +538,7 @@ class ComprehensiveGameCrawler:
                     stat_text = stat.get_text()
                     
                     # "94% of the 123,456 user reviews" 패턴 찾기
-                    match = re.search(r'(\d+)%\s+of\s+the\s+([\d,]+)\s+user\s+reviews', stat_text)
+                    match = REVIEW_SUMMARY_PATTERN.search(stat_text)
                     if match:
                         review_info['total_positive_percent'] = int(match.group(1))
                         review_info['total_review_count'] = match.group(2)
@@ -539,13 +554,7 @@ class ComprehensiveGameCrawler:
         header_images = []
         
         # HTML에서 헤더 이미지 찾기
-        header_selectors = [
-            '.game_header_image_full',
-            '.game_header_image img',
-            '.page_header_image img'
-        ]
-        
-        for selector in header_selectors:
+        for selector in self.HEADER_SELECTORS:
             elements = soup.select(selector)
             for elem in elements:
                 src = elem.get('src', '')
@@ -597,10 +606,11 @@ class ComprehensiveGameCrawler:
                     async with session.get(url, headers=self.headers, cookies=cookies) as response:
                         # 성공적인 응답
                         if response.status == 200:
-                            html = await response.text()
+                            # str 디코딩 없이 바이트를 그대로 파서에 넘김 (인코딩은 lxml이 판별)
+                            html = await response.read()
                             
                             # 나이 인증 페이지로 리다이렉트된 경우 처리
-                            if 'agecheck' in response.url.path or 'agegate' in html.lower():
+                            if 'agecheck' in response.url.path or b'agegate' in html.lower():
                                 html = await self.handle_age_check(session, str(response.url))
                                 if not html:
                                     return {
@@ -610,7 +620,7 @@ class ComprehensiveGameCrawler:
                                         'app_id': app_id
                                     }
                             
-                            soup = BeautifulSoup(html, 'html.parser')
+                            soup = BeautifulSoup(html, 'lxml')
                             
                             # 모든 정보 추출
                             game_info = {
@@ -775,7 +785,7 @@ def save_game_info_json(result: Dict[str, Any], filename: Optional[str] = None)
         app_id = game_info.get('app_id', 'unknown')
         title = game_info.get('title', 'unknown').replace('/', '_').replace('\\', '_')
         # 파일명에 사용할 수 없는 문자 제거
-        safe_title = re.sub(r'[<>:"|?*]', '', title)[:50]
+        safe_title = UNSAFE_FILENAME_PATTERN.sub('', title)[:50]
         filename = f"game_{app_id}_{safe_title}.json"
     
     # 저장 디렉토리 생성
@@ -785,27 +795,56 @@ def save_game_info_json(result: Dict[str, Any], filename: Optional[str] = None)
     # 파일 경로
     file_path = save_dir / filename
     
-    # JSON으로 저장
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(game_info, f, ensure_ascii=False, indent=2)
+    # JSON으로 저장 (orjson은 UTF-8 바이트를 바로 만들어 주므로 바이너리로 기록)
+    file_path.write_bytes(orjson.dumps(game_info, option=orjson.OPT_INDENT_2))
     
     logger.info(f"게임 정보가 저장되었습니다: {file_path}")
     return str(file_path)
 
 
+def _game_info_to_csv_row(game_info: Dict[str, Any]) -> Dict[str, Any]:
+    """게임 정보를 CSV 한 행으로 평탄화합니다."""
+    # 같은 키를 여러 번 조회하지 않도록 한 번씩만 꺼내 둠
+    description = game_info.get('description', '')
+    detailed_description = game_info.get('detailed_description', '')
+    price_info = game_info.get('price_info', {})
+    developer_publisher = game_info.get('developer_publisher', {})
+    review_info = game_info.get('review_info', {})
+    header_images = game_info.get('header_images')
+    
+    return {
+        'app_id': game_info.get('app_id', ''),
+        'title': game_info.get('title', ''),
+        'description': description[:200] + '...' if len(description) > 200 else description,
+        'detailed_description': detailed_description[:500] + '...' if len(detailed_description) > 500 else detailed_description,
+        'current_price': price_info.get('current_price', ''),
+        'original_price': price_info.get('original_price', ''),
+        'discount_percent': price_info.get('discount_percent', ''),
+        'is_free': price_info.get('is_free', False),
+        'developer': developer_publisher.get('developer', ''),
+        'publisher': developer_publisher.get('publisher', ''),
+        'release_date': game_info.get('release_date', ''),
+        'all_reviews': review_info.get('all_reviews', ''),
+        'total_review_count': review_info.get('total_review_count', ''),
+        'total_positive_percent': review_info.get('total_positive_percent', ''),
+        'tags': ', '.join(game_info.get('tags', [])),
+        'genres': ', '.join(game_info.get('genres', [])),
+        'header_image': header_images[0] if header_images else '',
+        'crawled_at': game_info.get('crawled_at', '')
+    }
+
+
 def save_multiple_games_csv(results: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
     """여러 게임 정보를 CSV 파일로 저장합니다."""
     if not results:
         raise ValueError("저장할 결과가 없습니다.")
     
-    # 성공한 결과만 필터링
-    successful_results = [result for result in results if result.get('success', False)]
+    # 성공한 결과의 게임 정보만 한 번에 추출
+    games_info = [result['data'] for result in results if result.get('success', False)]
     
-    if not successful_results:
+    if not games_info:
         raise ValueError("성공한 결과가 없어 저장할 수 없습니다.")
     
-    games_info = [result['data'] for result in successful_results]
-    
     # 파일명 생성
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -826,34 +865,11 @@ def save_multiple_games_csv(results: List[Dict[str, Any]], filename: Optional[st
         'tags', 'genres', 'header_image', 'crawled_at'
     ]
     
-    # CSV로 저장
-    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+    # CSV로 저장 (행 단위 writerow 대신 한 번에 기록)
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.DictWriter(f, fieldnames=headers)
         writer.writeheader()
-        
-        for game_info in games_info:
-            # 데이터 평탄화
-            row = {
-                'app_id': game_info.get('app_id', ''),
-                'title': game_info.get('title', ''),
-                'description': game_info.get('description', '')[:200] + '...' if len(game_info.get('description', '')) > 200 else game_info.get('description', ''),
-                'detailed_description': game_info.get('detailed_description', '')[:500] + '...' if len(game_info.get('detailed_description', '')) > 500 else game_info.get('detailed_description', ''),
-                'current_price': game_info.get('price_info', {}).get('current_price', ''),
-                'original_price': game_info.get('price_info', {}).get('original_price', ''),
-                'discount_percent': game_info.get('price_info', {}).get('discount_percent', ''),
-                'is_free': game_info.get('price_info', {}).get('is_free', False),
-                'developer': game_info.get('developer_publisher', {}).get('developer', ''),
-                'publisher': game_info.get('developer_publisher', {}).get('publisher', ''),
-                'release_date': game_info.get('release_date', ''),
-                'all_reviews': game_info.get('review_info', {}).get('all_reviews', ''),
-                'total_review_count': game_info.get('review_info', {}).get('total_review_count', ''),
-                'total_positive_percent': game_info.get('review_info', {}).get('total_positive_percent', ''),
-                'tags': ', '.join(game_info.get('tags', [])),
-                'genres': ', '.join(game_info.get('genres', [])),
-                'header_image': game_info.get('header_images', [''])[0] if game_info.get('header_images') else '',
-                'crawled_at': game_info.get('crawled_at', '')
-            }
-            writer.writerow(row)
+        writer.writerows(_game_info_to_csv_row(game_info) for game_info in games_info)
     
     logger.info(f"{len(games_info)}개 게임 정보가 CSV로 저장되었습니다: {file_path}")
     return str(file_path)
@@ -861,8 +877,7 @@ def save_multiple_games_csv(results: List[Dict[str, Any]], filename: Optional[st
 
 def load_game_info_json(file_path: str) -> Dict[str, Any]:
     """JSON 파일에서 게임 정보를 불러옵니다."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return orjson.loads(Path(file_path).read_bytes())
 
 
 def print_game_info(result: Dict[str, Any]):
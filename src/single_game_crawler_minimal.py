@@ -46,8 +46,25 @@ from utils.logger import setup_logger
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 반복 사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+DISCOUNT_PATTERN = re.compile(r'-(\d+)%')
+REVIEW_COUNT_PATTERN = re.compile(r'\((\d{1,3}(?:,\d{3})*)\)')
+REVIEW_PERCENT_PATTERN = re.compile(r'(\d+)%\s+of\s+the\s+\d+')
+REVIEW_SUMMARY_PATTERN = re.compile(r'(\d+)%\s+of\s+the\s+([\d,]+)\s+user\s+reviews')
+
 class MinimalGameCrawler:
     """Steam 게임 페이지에서 API로 제공되지 않는 핵심 정보만 크롤링"""
+
+    # 페이지마다 리스트를 새로 만들지 않도록 CSS 선택자를 클래스 상수로 둠
+    TAG_SELECTORS = (
+        'a.app_tag',  # 가장 일반적인 사용자 태그
+        '.popular_tags a',  # 인기 태그 섹션
+        '.game_area_details_specs a',  # 상세 정보 섹션의 태그
+    )
+    CURRENT_PRICE_SELECTORS = (
+        '.game_purchase_price',  # 일반 가격
+        '.discount_final_price',  # 할인된 최종 가격
+    )
     
     def __init__(self):
         self.base_url = "https://store.steampowered.com/app/"
@@ -90,24 +107,19 @@ class MinimalGameCrawler:
 
     def extract_user_tags(self, soup: BeautifulSoup) -> List[str]:
         """사용자가 붙인 태그를 추출합니다."""
-        tags = []
-        tag_selectors = [
-            'a.app_tag',  # 가장 일반적인 사용자 태그
-            '.popular_tags a',  # 인기 태그 섹션
-            '.game_area_details_specs a'  # 상세 정보 섹션의 태그
-        ]
-        
-        for selector in tag_selectors:
+        # 순서를 유지하면서 중복을 O(1)로 거르도록 dict를 순서 있는 집합으로 사용
+        tags: Dict[str, None] = {}
+        for selector in self.TAG_SELECTORS:
             tag_elements = soup.select(selector)
             if tag_elements:
                 for tag in tag_elements:
                     tag_text = tag.get_text(strip=True)
                     # 빈 태그나 중복 제거
-                    if tag_text and tag_text not in tags and len(tag_text) < 30:
-                        tags.append(tag_text)
+                    if tag_text and len(tag_text) < 30:
+                        tags[tag_text] = None
                 break  # 첫 번째로 찾은 선택자만 사용
         
-        return tags
+        return list(tags)
 
     def extract_review_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """리뷰/평점 정보를 추출합니다."""
@@ -138,24 +150,24 @@ class MinimalGameCrawler:
                 # 최근 리뷰 섹션
                 if 'Recent Reviews' in section_text or '최근 리뷰' in section_text:
                     # 리뷰 개수 추출
-                    count_match = re.search(r'\((\d{1,3}(?:,\d{3})*)\)', section_text)
+                    count_match = REVIEW_COUNT_PATTERN.search(section_text)
                     if count_match:
                         review_info['recent_review_count'] = count_match.group(1)
                     
                     # 긍정 비율 추출
-                    percent_match = re.search(r'(\d+)%\s+of\s+the\s+\d+', section_text)
+                    percent_match = REVIEW_PERCENT_PATTERN.search(section_text)
                     if percent_match:
                         review_info['recent_positive_percent'] = int(percent_match.group(1))
                 
                 # 전체 리뷰 섹션
                 elif 'All Reviews' in section_text or '모든 리뷰' in section_text:
                     # 리뷰 개수 추출
-                    count_match = re.search(r'\((\d{1,3}(?:,\d{3})*)\)', section_text)
+                    count_match = REVIEW_COUNT_PATTERN.search(section_text)
                     if count_match:
                         review_info['total_review_count'] = count_match.group(1)
                     
                     # 긍정 비율 추출
-                    percent_match = re.search(r'(\d+)%\s+of\s+the\s+\d+', section_text)
+                    percent_match = REVIEW_PERCENT_PATTERN.search(section_text)
                     if percent_match:
                         review_info['total_positive_percent'] = int(percent_match.group(1))
             
@@ -166,7 +178,7 @@ class MinimalGameCrawler:
                     stat_text = stat.get_text()
                     
                     # "94% of the 123,456 user reviews" 패턴
-                    match = re.search(r'(\d+)%\s+of\s+the\s+([\d,]+)\s+user\s+reviews', stat_text)
+                    match = REVIEW_SUMMARY_PATTERN.search(stat_text)
                     if match:
                         review_info['total_positive_percent'] = int(match.group(1))
                         review_info['total_review_count'] = match.group(2)
@@ -197,12 +209,7 @@ class MinimalGameCrawler:
                     return price_info
             
             # 현재 가격 (할인된 가격 포함)
-            current_price_selectors = [
-                '.game_purchase_price',      # 일반 가격
-                '.discount_final_price'      # 할인된 최종 가격
-            ]
-            
-            for selector in current_price_selectors:
+            for selector in self.CURRENT_PRICE_SELECTORS:
                 element = soup.select_one(selector)
                 if element:
                     price_text = element.get_text(strip=True)
@@ -220,7 +227,7 @@ class MinimalGameCrawler:
             if discount_element:
                 discount_text = discount_element.get_text(strip=True)
                 # "-50%" 형태에서 숫자만 추출
-                discount_match = re.search(r'-(\d+)%', discount_text)
+                discount_match = DISCOUNT_PATTERN.search(discount_text)
                 if discount_match:
                     price_info['discount_percent'] = int(discount_match.group(1))
                     
@@ -249,10 +256,11 @@ class MinimalGameCrawler:
                     
                     async with session.get(url, headers=self.headers, cookies=cookies) as response:
                         if response.status == 200:
-                            html = await response.text()
+                            # str 디코딩 없이 바이트를 그대로 파서에 넘김 (인코딩은 lxml이 판별)
+                            html = await response.read()
                             
                             # 나이 인증 처리
-                            if 'agecheck' in response.url.path or 'agegate' in html.lower():
+                            if 'agecheck' in response.url.path or b'agegate' in html.lower():
                                 html = await self.handle_age_check(session, str(response.url))
                                 if not html:
                                     return {
@@ -262,7 +270,7 @@ class MinimalGameCrawler:
                                         'app_id': app_id
                                     }
                             
-                            soup = BeautifulSoup(html, 'html.parser')
+                            soup = BeautifulSoup(html, 'lxml')
                             
                             # 게임 제목으로 유효성 확인
                             title_element = soup.select_one('.apphub_AppName, h1.pageheader, .game_title h1')
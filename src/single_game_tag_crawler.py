@@ -1,15 +1,85 @@
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
-from typing import List, Optional
+from yarl import URL
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, List, Optional
 import time
+import re
+from html import unescape
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.retry import get_retry_delay
+
+logger = logging.getLogger(__name__)
+
+# 나이 인증 쿠키를 저장할 기준 URL (쿠키 path가 /가 되도록 루트 사용)
+STORE_ROOT_URL = URL("https://store.steampowered.com/")
+
+# 파싱 프로세스 풀의 워커 시작 방식 (forkserver를 지원하지 않는 플랫폼은 spawn)
+PROCESS_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
 
 class SingleGameCrawler:
-    def __init__(self):
+    # 페이지마다 리스트를 새로 만들지 않도록 CSS 선택자를 클래스 상수로 둠
+    TAG_SELECTORS = (
+        'a.app_tag',
+        '.popular_tags a',
+        '.game_area_details_specs a',
+    )
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, max_concurrency: int = 16,
+                 executor: Optional[Executor] = None):
         self.base_url = "https://store.steampowered.com/app/"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        # 여러 요청이 공유하는 세션 (외부에서 주입하지 않으면 처음 사용할 때 생성)
+        self._session = session
+        self._owns_session = session is None
+        self._cookies_seeded = False
+        # 동시에 진행되는 페이지 요청 수 제한 (커넥터의 limit_per_host와 맞춤)
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # 같은 게임 ID에 대해 진행 중인 요청 (중복 호출은 이 태스크의 결과를 함께 기다림)
+        self._inflight: Dict[int, asyncio.Task] = {}
+        # 페이지 파싱을 실행할 executor (None이면 이벤트 루프의 기본 스레드 풀)
+        self._executor = executor
+
+    async def __aenter__(self) -> "SingleGameCrawler":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """keep-alive 연결과 DNS 캐시를 재사용하는 공유 세션을 반환합니다."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=max(100, self._max_concurrency),
+                limit_per_host=self._max_concurrency,
+                ttl_dns_cache=600,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10)
+            )
+            self._owns_session = True
+            self._cookies_seeded = False
+        if not self._cookies_seeded:
+            # 나이 인증 쿠키는 세션 쿠키 저장소에 한 번만 넣어 두고 모든 요청에서 재사용
+            # 앱 경로(/app/) 기준으로 넣으면 쿠키 path가 /app/로 잡히므로 사이트 루트 기준으로 넣음
+            self._session.cookie_jar.update_cookies(self.get_age_verification_cookies(), STORE_ROOT_URL)
+            self._cookies_seeded = True
+        return self._session
+
+    async def close(self) -> None:
+        """크롤러가 직접 만든 세션을 닫습니다."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
 
     def get_age_verification_cookies(self):
         """나이 인증을 우회하기 위한 쿠키를 생성합니다."""
@@ -43,85 +113,169 @@ class SingleGameCrawler:
             return None
 
     async def get_game_tags_with_retry(self, app_id: int, max_retries: int = 7) -> List[str]:
-        """재시도 로직이 포함된 게임 태그 추출 함수"""
+        """재시도 로직이 포함된 게임 태그 추출 함수 (같은 게임 ID의 동시 요청은 한 번만 수행)"""
+        task = self._inflight.get(app_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_game_tags(app_id, max_retries))
+            self._inflight[app_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(app_id, None))
+        # 한 호출자가 취소되어도 같은 결과를 기다리는 다른 호출자에게는 영향을 주지 않음 (결과 리스트는 호출자별로 복사)
+        return list(await asyncio.shield(task))
+
+    async def _fetch_game_tags(self, app_id: int, max_retries: int) -> List[str]:
+        """게임 페이지를 요청해 태그를 추출합니다."""
         url = f"{self.base_url}{app_id}"
         
         for attempt in range(max_retries + 1):
             try:
-                jar = aiohttp.CookieJar(unsafe=True)
-                async with aiohttp.ClientSession(cookie_jar=jar) as session:
-                    cookies = self.get_age_verification_cookies()
-                    
-                    async with session.get(url, headers=self.headers, cookies=cookies) as response:
-                        # 성공적인 응답
-                        if response.status == 200:
-                            html = await response.text()
-                            
-                            # 나이 인증 페이지로 리다이렉트된 경우 처리
-                            if 'agecheck' in response.url.path or 'agegate' in html.lower():
-                                html = await self.handle_age_check(session, str(response.url))
-                                if not html:
-                                    return []
-                            
-                            soup = BeautifulSoup(html, 'html.parser')
-                            
-                            # 태그 추출
-                            tags = []
-                            tag_selectors = [
-                                'a.app_tag',
-                                '.popular_tags a',
-                                '.game_area_details_specs a'
-                            ]
-                            
-                            for selector in tag_selectors:
-                                tag_elements = soup.select(selector)
-                                if tag_elements:
-                                    for tag in tag_elements:
-                                        tag_text = tag.get_text(strip=True)
-                                        if tag_text and tag_text not in tags:
-                                            tags.append(tag_text)
-                                    break
-                            
-                            return tags
-                        
-                        # 요청 제한 관련 상태 코드
-                        elif response.status in [429, 503, 502, 504]:
-                            if attempt < max_retries:
-                                # 지수적으로 증가하는 딜레이 (10초, 20초, 40초, 80초, 160초, 320초, 640초)
-                                delay = 2 * (2 ** attempt)
-                                print(f"  ⚠️  게임 ID {app_id}: HTTP {response.status} - {attempt + 1}회 실패, {delay}초 후 재시도...")
-                                await asyncio.sleep(delay)
-                                continue
-                            else:
-                                print(f"  ❌ 게임 ID {app_id}: HTTP {response.status} - 최대 재시도 횟수 초과")
-                                raise Exception(f"HTTP {response.status}: 최대 재시도 횟수({max_retries})를 초과했습니다. 요청이 지속적으로 거부되고 있습니다.")
-                        
-                        # 기타 HTTP 에러
-                        else:
-                            print(f"  ❌ 게임 ID {app_id}: HTTP {response.status} 오류")
+                session = await self.get_session()
+                
+                # 상태/본문만 읽고 바로 블록을 빠져나와 연결과 동시 요청 슬롯을 반납
+                async with self._semaphore, session.get(url, headers=self.headers) as response:
+                    status = response.status
+                    if status == 200:
+                        # str 디코딩 없이 바이트를 그대로 파서에 넘김 (인코딩은 lxml이 판별)
+                        html = await response.read()
+                
+                # 성공적인 응답
+                if status == 200:
+                    # 나이 인증 페이지로 리다이렉트된 경우 처리
+                    if 'agecheck' in response.url.path or b'agegate' in html.lower():
+                        async with self._semaphore:
+                            html = await self.handle_age_check(session, str(response.url))
+                        if not html:
                             return []
-                            
+                    
+                    # CPU를 쓰는 HTML 파싱은 이벤트 루프 밖(executor)에서 수행
+                    return await self._parse_in_executor(html)
+                
+                # 요청 제한 관련 상태 코드
+                elif status in [429, 503, 502, 504]:
+                    if attempt < max_retries:
+                        delay = get_retry_delay(response, attempt)
+                        logger.warning(f"게임 ID {app_id}: HTTP {status} - {attempt + 1}회 실패, {delay:.0f}초 후 재시도...")
+                        await asyncio.sleep(delay)
+                        continue
+                    else:
+                        logger.error(f"게임 ID {app_id}: HTTP {status} - 최대 재시도 횟수 초과")
+                        raise Exception(f"HTTP {status}: 최대 재시도 횟수({max_retries})를 초과했습니다. 요청이 지속적으로 거부되고 있습니다.")
+                
+                # 기타 HTTP 에러
+                else:
+                    logger.error(f"게임 ID {app_id}: HTTP {status} 오류")
+                    return []
+                    
             except Exception as e:
-                if attempt < max_retries and "HTTP" in str(e) and any(code in str(e) for code in ["429", "503", "502", "504"]):
-                    # 재시도 가능한 네트워크 오류
+                retryable = isinstance(e, asyncio.TimeoutError) or (
+                    "HTTP" in str(e) and any(code in str(e) for code in ["429", "503", "502", "504"])
+                )
+                if attempt < max_retries and retryable:
+                    # 재시도 가능한 네트워크 오류 (타임아웃 포함)
                     delay = 10 * (2 ** attempt)
-                    print(f"  ⚠️  게임 ID {app_id}: 네트워크 오류 - {attempt + 1}회 실패, {delay}초 후 재시도... ({str(e)})")
+                    logger.warning(f"게임 ID {app_id}: 네트워크 오류 - {attempt + 1}회 실패, {delay}초 후 재시도... ({str(e)})")
                     await asyncio.sleep(delay)
                     continue
                 elif attempt == max_retries:
-                    print(f"  ❌ 게임 ID {app_id}: 최대 재시도 횟수 초과 - {str(e)}")
+                    logger.error(f"게임 ID {app_id}: 최대 재시도 횟수 초과 - {str(e)}")
                     raise Exception(f"최대 재시도 횟수({max_retries})를 초과했습니다. 마지막 오류: {str(e)}")
                 else:
-                    print(f"  ❌ 게임 ID {app_id}: 크롤링 오류 - {str(e)}")
+                    logger.error(f"게임 ID {app_id}: 크롤링 오류 - {str(e)}")
                     return []
         
         return []
 
+    async def _parse_in_executor(self, html) -> List[str]:
+        """executor에서 태그를 파싱합니다 (프로세스 풀이 깨지면 기본 스레드 풀로 전환)."""
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            return await loop.run_in_executor(executor, parse_game_tags, html)
+        except BrokenProcessPool as e:
+            # 워커 프로세스가 죽은 경우 (예: 실행 스크립트에 __main__ 가드가 없음) 빈 결과 대신 스레드에서 다시 파싱
+            if self._executor is executor:
+                logger.warning(f"파싱 프로세스 풀을 사용할 수 없어 스레드에서 파싱합니다 "
+                               f"(실행 스크립트에 if __name__ == \"__main__\": 가드가 있는지 확인하세요) - {str(e)}")
+                self._executor = None
+            return await loop.run_in_executor(None, parse_game_tags, html)
+
     async def get_game_tags(self, app_id: int) -> List[str]:
         """기존 호환성을 위한 래퍼 함수"""
         return await self.get_game_tags_with_retry(app_id)
 
 
+# 빠른 경로에서 사용할 태그 링크 패턴과 필터
+# class 속성(큰따옴표/작은따옴표)의 클래스 토큰 중에 app_tag가 있는 <a> 여는 태그
+APP_TAG_LINK = (rb'<a\b[^>]*?\bclass\s*=\s*(?P<quote>["\'])(?:(?!(?P=quote))[^>])*?'
+                rb'(?<![\w-])app_tag(?![\w-])(?:(?!(?P=quote))[^>])*(?P=quote)[^>]*>')
+APP_TAG_PATTERN = re.compile(APP_TAG_LINK + rb'(?P<tag>[^<]*)</a>')
+# 정규식으로는 DOM과 같게 해석할 수 없는 영역 (주석, 스크립트, 스타일)
+APP_TAG_OPAQUE_PATTERN = re.compile(rb'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+# class 속성 문자열 전체가 아니라 공백으로 나뉜 클래스 토큰 중에 app_tag가 있는지 확인 (a.app_tag 선택자와 동일)
+APP_TAG_STRAINER = SoupStrainer('a', class_=lambda classes: classes is not None and 'app_tag' in classes.split())
+
+
+def parse_game_tags(html) -> List[str]:
+    """
+    게임 페이지 HTML에서 태그를 추출합니다.
+
+    프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둡니다.
+    """
+    # 표준 템플릿 페이지는 DOM을 만들지 않고 정규식으로 바로 추출
+    if isinstance(html, bytes):
+        tags = _match_game_tags(html)
+        if tags:
+            return tags
+
+    # 대부분의 페이지는 a.app_tag에 태그가 있으므로 해당 링크만 트리로 구성
+    soup = BeautifulSoup(html, 'lxml', parse_only=APP_TAG_STRAINER)
+    # 순서를 유지하면서 중복을 O(1)로 거르도록 dict를 순서 있는 집합으로 사용
+    tags: Dict[str, None] = {}
+    for tag in soup.find_all('a'):
+        tag_text = tag.get_text(strip=True)
+        if tag_text:
+            tags[tag_text] = None
+    if tags:
+        return list(tags)
+
+    # 없으면 전체 페이지를 파싱해 나머지 선택자로 찾음
+    return _select_game_tags(html)
+
+
+def _match_game_tags(html: bytes) -> Optional[List[str]]:
+    """정규식으로 a.app_tag 링크의 태그를 추출합니다 (DOM 파싱과 결과가 같다고 확신할 수 없으면 None)."""
+    matches = APP_TAG_PATTERN.findall(html)
+    # 문서의 모든 app_tag가 텍스트만 담은 링크로 잡혀야 함
+    # (따옴표 없는 class, 중첩 마크업, 비슷한 클래스명 등이 있으면 DOM 파싱으로 넘김)
+    if not matches or len(matches) != html.count(b'app_tag'):
+        return None
+    if any(b'app_tag' in region.group() for region in APP_TAG_OPAQUE_PATTERN.finditer(html)):
+        return None
+
+    tags: Dict[str, None] = {}
+    for match in matches:
+        # DOM 파싱의 get_text(strip=True)와 같도록 엔티티를 풀고 나서 공백 제거
+        tag_text = unescape(match[1].decode('utf-8', 'replace')).strip()
+        if tag_text:
+            tags[tag_text] = None
+    return list(tags)
+
+
+def _select_game_tags(html) -> List[str]:
+    """전체 페이지를 파싱해 태그 선택자 목록으로 태그를 추출합니다."""
+    soup = BeautifulSoup(html, 'lxml')
+    tags: Dict[str, None] = {}
+    for selector in SingleGameCrawler.TAG_SELECTORS:
+        tag_elements = soup.select(selector)
+        if tag_elements:
+            for tag in tag_elements:
+                tag_text = tag.get_text(strip=True)
+                if tag_text:
+                    tags[tag_text] = None
+            break
+
+    return list(tags)
+
+
 # 편의 함수
 async def get_steam_game_tags(app_id: int, max_retries: int = 7) -> List[str]:
     """
@@ -138,8 +292,67 @@ async def get_steam_game_tags(app_id: int, max_retries: int = 7) -> List[str]:
         tags = await get_steam_game_tags(1091500)  # Cyberpunk 2077
         print(tags)  # ['Cyberpunk', 'Open World', 'RPG', ...]
     """
-    crawler = SingleGameCrawler()
-    return await crawler.get_game_tags_with_retry(app_id, max_retries)
+    async with SingleGameCrawler() as crawler:
+        return await crawler.get_game_tags_with_retry(app_id, max_retries)
+
+
+async def get_multiple_steam_game_tags(app_ids: List[int], max_retries: int = 7,
+                                       max_concurrency: int = 16) -> Dict[int, List[str]]:
+    """
+    여러 Steam 게임의 태그를 하나의 세션으로 수집하는 함수
+
+    게임마다 태스크를 만들지 않고, max_concurrency개의 워커가 큐에서
+    게임 ID를 꺼내 처리하므로 대기 중인 태스크 수가 워커 수로 제한됩니다.
+
+    페이지 파싱은 forkserver/spawn 방식의 프로세스 풀에서 수행되며, 워커가
+    실행 스크립트를 다시 import하므로 호출하는 스크립트는 반드시
+    `if __name__ == "__main__":` 가드 안에서 실행해야 합니다. 가드가 없어
+    워커가 죽으면 경고를 남기고 스레드에서 파싱합니다.
+
+    Args:
+        app_ids (List[int]): Steam 게임 ID 목록
+        max_retries (int): 게임별 최대 재시도 횟수
+        max_concurrency (int): 동시에 실행할 워커 수
+
+    Returns:
+        Dict[int, List[str]]: 게임 ID별 태그 목록 (실패한 게임은 빈 리스트)
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for app_id in app_ids:
+        queue.put_nowait(app_id)
+
+    results: Dict[int, List[str]] = {}
+
+    # 여러 페이지를 파싱하므로 프로세스 풀로 CPU 코어에 분산
+    # (스레드가 떠 있는 프로세스를 fork하면 안전하지 않으므로 forkserver/spawn으로 워커 생성)
+    executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context(PROCESS_START_METHOD))
+    try:
+        async with SingleGameCrawler(max_concurrency=max_concurrency, executor=executor) as crawler:
+            await _drain_tag_queue(crawler, queue, results, max_retries, max_concurrency)
+    finally:
+        # 워커 종료를 기다리는 동안 이벤트 루프가 멈추지 않도록 스레드에서 shutdown
+        await asyncio.to_thread(executor.shutdown)
+
+    return results
+
+
+async def _drain_tag_queue(crawler: SingleGameCrawler, queue: asyncio.Queue, results: Dict[int, List[str]],
+                           max_retries: int, max_concurrency: int) -> None:
+    """워커들이 큐가 빌 때까지 게임 ID를 꺼내 태그를 수집합니다."""
+    async def worker():
+        while True:
+            try:
+                app_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                results[app_id] = await crawler.get_game_tags_with_retry(app_id, max_retries)
+            except Exception as e:
+                logger.error(f"게임 ID {app_id}: 태그 수집 실패 - {str(e)}")
+                results[app_id] = []
+
+    workers = min(max_concurrency, queue.qsize())
+    await asyncio.gather(*(worker() for _ in range(workers)))
 
 
 # 동기 버전 (asyncio.run 사용)
@@ -161,6 +374,42 @@ def get_steam_game_tags_sync(app_id: int, max_retries: int = 7) -> List[str]:
     return asyncio.run(get_steam_game_tags(app_id, max_retries))
 
 
+# 태그 추출 빠른 경로 테스트
+def test_parse_game_tags():
+    """parse_game_tags의 결과가 전체 파싱 선택자 경로(_select_game_tags)와 같은지 비교 테스트"""
+    samples = [
+        # 중복 태그와 앞뒤 공백
+        b'<a href="#" class="app_tag">RPG</a><a class="app_tag">  Open World </a><a class="app_tag">RPG</a>',
+        # 여러 클래스와 작은따옴표 속성
+        b"<a class=\"app_tag extra\">Action</a><a class='btn app_tag'>Indie</a>",
+        # HTML 엔티티 (&nbsp;는 공백 제거 전에 풀어야 함)
+        b'<a class="app_tag">Rock &amp; Roll</a><a class="app_tag">A&nbsp;</a>',
+        # 공백만 있는 링크와 중첩 마크업
+        b'<a class="app_tag">   </a><a class="app_tag"><span>Puzzle</span></a><a class="app_tag">Casual</a>',
+        # 주석 안의 링크
+        b'<!-- <a class="app_tag">Hidden</a> --><a class="app_tag">Visible</a>',
+        # 따옴표 없는 class 속성
+        b'<a class=app_tag>B</a><a class="app_tag">C</a>',
+        # 비슷한 클래스명
+        b'<a class="no_app_tag">Ad</a><a class="app_tagged">Ad</a><a class="app_tag">Sports</a>',
+        # a.app_tag가 없어 대체 선택자를 사용하는 페이지
+        b'<div class="popular_tags"><a href="#">Strategy</a><a href="#">Simulation</a></div>',
+    ]
+
+    failed = 0
+    for sample in samples:
+        fast_tags = parse_game_tags(sample)
+        full_tags = _select_game_tags(sample)
+        if fast_tags == full_tags:
+            print(f"✅ {fast_tags}")
+        else:
+            failed += 1
+            print(f"❌ {sample!r}\n   빠른 경로: {fast_tags}\n   전체 파싱: {full_tags}")
+
+    print(f"\n{len(samples) - failed}/{len(samples)}개 일치")
+    return failed == 0
+
+
 # 테스트용 메인 함수
 async def main():
     # 테스트
@@ -177,4 +426,5 @@ async def main():
 
 if __name__ == "__main__":
     print(get_steam_game_tags_sync(1284790)) # 로그인 필요 게임
-    #print(get_steam_game_tags_sync(1245620)) # 로그인이 필요없는 나이제한 게임
\ No newline at end of file
+    #print(get_steam_game_tags_sync(1245620)) # 로그인이 필요없는 나이제한 게임
+    #test_parse_game_tags() # 태그 추출 빠른 경로와 전체 파싱 결과 비교
@@ -3,5 +3,6 @@ Steam 게임 크롤링 프로젝트의 공용 유틸리티 모듈
 """
 
 from .logger import setup_logger
+from .retry import get_retry_delay
 
-__all__ = ['setup_logger'] 
\ No newline at end of file
+__all__ = ['setup_logger', 'get_retry_delay'] 
\ No newline at end of file
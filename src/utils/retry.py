@@ -0,0 +1,19 @@
+"""
+HTTP 요청 재시도 유틸리티
+"""
+
+import random
+
+import aiohttp
+
+
+def get_retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """재시도 전 대기 시간을 계산합니다.
+
+    서버가 Retry-After 헤더를 보내면 그 값에 약간의 지터를 더해 따르고, 없으면
+    지수적으로 증가하는 딜레이 (2초, 4초, 8초, 16초, 32초, 64초, 128초)를 사용합니다.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        return int(retry_after) + random.uniform(0, 1)
+    return 2 * (2 ** attempt)